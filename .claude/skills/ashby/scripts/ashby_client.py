@@ -20,28 +20,139 @@ Usage:
 
 import argparse
 import base64
+import functools
+import hashlib
 import json
 import os
 import sys
+import tempfile
+import threading
 import time
 from collections import defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Any, Optional
 
 try:
     import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
 except ImportError:
     print("Error: requests not installed. Run: pip install requests")
     sys.exit(1)
 
+# orjson is optional; it decodes and encodes large list payloads several
+# times faster than the stdlib json module.
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    orjson = None
+    _loads = json.loads
+
 
 BASE_URL = "https://api.ashbyhq.com"
 
+# Read endpoints are idempotent: retry throttled (429) and unavailable
+# (503) responses, honoring the server's Retry-After header, as well as
+# connection and read errors.
+_READ_RETRY = Retry(
+    total=5,
+    backoff_factor=0.5,
+    status_forcelist=[429, 503],
+    allowed_methods=["POST"],
+    respect_retry_after_header=True,
+    raise_on_status=False,
+)
+
+# Writes like candidate.createNote are retried only when the server cannot
+# have applied them: the connection could not be made, or the request was
+# throttled (429, honoring Retry-After). After a read error or dropped
+# connection the write may already have gone through, and a retry would
+# duplicate the note or tag.
+_WRITE_RETRY = Retry(
+    total=5,
+    connect=3,
+    read=0,
+    other=0,
+    status=3,
+    backoff_factor=0.5,
+    status_forcelist=[429],
+    allowed_methods=["POST"],
+    respect_retry_after_header=True,
+    raise_on_status=False,
+)
+
+
+def _make_session(retry: Retry, pool_maxsize: int) -> "requests.Session":
+    """Create a session with a pooled adapter using the given retry policy."""
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(
+        pool_connections=4, pool_maxsize=pool_maxsize, max_retries=retry,
+    ))
+    return session
+
+
+# Shared sessions so every call reuses pooled keep-alive connections to the
+# API host instead of paying a fresh TCP+TLS handshake per request. Reads
+# and writes differ only in their retry policy.
+_SESSION = _make_session(_READ_RETRY, pool_maxsize=32)
+_WRITE_SESSION = _make_session(_WRITE_RETRY, pool_maxsize=4)
+
+# Worker count for commands that fan out many independent API calls.
+MAX_WORKERS = 8
+
+# Ashby max records per list page.
+MAX_PAGE_SIZE = 100
+
 
 # =============================================================================
 # CORE API FUNCTIONS
 # =============================================================================
 
 
+class TokenBucket:
+    """Thread-safe token bucket rate limiter.
+
+    Permits bursts of up to ``capacity`` calls and refills at ``rate``
+    tokens per second, so callers only block when the short-term request
+    rate actually exceeds the budget.
+    """
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, n: float = 1) -> None:
+        """Take n tokens, sleeping until they are available."""
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(
+                self.capacity, self.tokens + (now - self.last) * self.rate,
+            )
+            self.last = now
+            # Reserve the tokens up front; a negative balance makes later
+            # callers wait their turn behind this one.
+            self.tokens -= n
+            wait = -self.tokens / self.rate if self.tokens < 0 else 0.0
+
+        if wait > 0:
+            time.sleep(wait)
+
+
+# Request budget shared by every api_call, including worker threads.
+_BUCKET = TokenBucket(rate=8, capacity=16)
+
+# Read-only endpoints whose concurrent duplicate calls can share one request.
+_READ_SUFFIXES = (".info", ".list", ".search")
+
+# In-flight read calls keyed by (endpoint, canonical JSON body).
+_INFLIGHT: dict = {}
+_INFLIGHT_LOCK = threading.Lock()
+
+
 def get_api_key() -> str:
     """Get Ashby API key from environment."""
     key = (
@@ -54,32 +165,75 @@ def get_api_key() -> str:
     return key
 
 
+@functools.lru_cache(maxsize=1)
+def _auth_header() -> str:
+    """Build the Basic auth header value once per process."""
+    # Basic auth: api_key as username, empty password.
+    token = base64.b64encode(f"{get_api_key()}:".encode()).decode()
+    return f"Basic {token}"
+
+
+def _session(write: bool = False) -> "requests.Session":
+    """Return the read or write session, setting auth headers on first use."""
+    session = _WRITE_SESSION if write else _SESSION
+    if "Authorization" not in session.headers:
+        session.headers.update({
+            "Authorization": _auth_header(),
+            "Content-Type": "application/json",
+            # JSON list pages compress well; requests decodes transparently.
+            "Accept-Encoding": "gzip, deflate",
+        })
+    return session
+
+
 def api_call(endpoint: str, **params) -> dict:
     """Make an Ashby API call.
 
     All Ashby endpoints are POST with JSON bodies and Basic Auth.
+    Concurrent identical read calls are coalesced: later callers wait on
+    the request already in flight instead of issuing a duplicate.
     """
-    key = get_api_key()
-    # Basic auth: api_key as username, empty password.
-    auth_token = base64.b64encode(f"{key}:".encode()).decode()
-
     # Strip None-valued params.
     body = {k: v for k, v in params.items() if v is not None}
 
+    # Never coalesce writes; two identical notes are two notes.
+    if not endpoint.endswith(_READ_SUFFIXES):
+        return _post(endpoint, body)
+
+    key = (endpoint, json.dumps(body, sort_keys=True, default=str))
+    with _INFLIGHT_LOCK:
+        future = _INFLIGHT.get(key)
+        owner = future is None
+        if owner:
+            future = _INFLIGHT[key] = Future()
+
+    if not owner:
+        return future.result()
+
+    try:
+        data = _post(endpoint, body)
+        future.set_result(data)
+        return data
+    except BaseException as e:
+        # Includes SystemExit, so waiters exit along with the owner.
+        future.set_exception(e)
+        raise
+    finally:
+        with _INFLIGHT_LOCK:
+            del _INFLIGHT[key]
+
+
+def _post(endpoint: str, body: dict) -> dict:
+    """POST a JSON body to an endpoint and return the decoded response."""
+    session = _session(write=not endpoint.endswith(_READ_SUFFIXES))
+    _BUCKET.acquire()
+
     url = f"{BASE_URL}/{endpoint}"
 
     try:
-        response = requests.post(
-            url,
-            json=body,
-            headers={
-                "Authorization": f"Basic {auth_token}",
-                "Content-Type": "application/json",
-            },
-            timeout=30,
-        )
+        response = session.post(url, json=body, timeout=30)
         response.raise_for_status()
-        data = response.json()
+        data = _loads(response.content)
 
         if not data.get("success", False):
             error_info = data.get("errorInfo", {})
@@ -96,6 +250,8 @@ def api_call(endpoint: str, **params) -> dict:
                 print("Error: Invalid or missing API key (HTTP 401)")
             elif status == 403:
                 print("Error: API key lacks required permissions (HTTP 403)")
+            elif status == 429:
+                print("Error: Rate limited by Ashby API, retries exhausted (HTTP 429)")
             else:
                 print(f"HTTP Error {status}: {e}")
         else:
@@ -104,54 +260,155 @@ def api_call(endpoint: str, **params) -> dict:
     except requests.exceptions.RequestException as e:
         print(f"Request failed: {e}")
         sys.exit(1)
+    except ValueError as e:
+        print(f"Invalid JSON response ({endpoint}): {e}")
+        sys.exit(1)
 
 
-def paginate(endpoint: str, limit: Optional[int] = None, **params) -> list:
-    """Paginate through an Ashby list endpoint.
+def iter_pages(
+    endpoint: str,
+    limit: Optional[int] = None,
+    page_size: int = MAX_PAGE_SIZE,
+    **params,
+):
+    """Yield successive result pages from an Ashby list endpoint.
 
-    Accumulates results across pages using cursor-based pagination.
-    Respects the optional limit parameter to cap total results.
+    As soon as a page's cursor is known the next page is requested in the
+    background, so fetching overlaps with the caller's work on the page
+    just yielded. Respects the optional limit parameter to cap results; a
+    zero or negative limit fetches everything. Pages hold at most
+    page_size records and never more than the limit still needs.
     """
-    all_results = []
-    cursor = None
+    if limit is not None and limit <= 0:
+        limit = None
+    page_size = max(1, min(page_size, MAX_PAGE_SIZE))
 
-    while True:
+    def fetch(cursor: Optional[str], fetched: int) -> dict:
         call_params = {**params}
         if cursor:
             call_params["cursor"] = cursor
-        # Ashby max per page is 100.
-        call_params["limit"] = min(100, limit - len(all_results)) if limit else 100
+        # Only ask for what the limit still needs.
+        call_params["limit"] = (
+            min(page_size, limit - fetched) if limit else page_size
+        )
+        return api_call(endpoint, **call_params)
+
+    fetched = 0
+    with ThreadPoolExecutor(max_workers=1) as prefetcher:
+        future = prefetcher.submit(fetch, None, 0)
+        while future is not None:
+            data = future.result()
+            results = data.get("results", [])
+            if limit:
+                results = results[:limit - fetched]
+            fetched += len(results)
+
+            # Queue the next page unless we've hit the limit or run out.
+            future = None
+            cursor = data.get("nextCursor")
+            more = data.get("moreDataAvailable", False)
+            if more and cursor and not (limit and fetched >= limit):
+                future = prefetcher.submit(fetch, cursor, fetched)
+
+            yield results
+
+
+def paginate(
+    endpoint: str,
+    limit: Optional[int] = None,
+    page_size: int = MAX_PAGE_SIZE,
+    **params,
+) -> list:
+    """Paginate through an Ashby list endpoint.
 
-        data = api_call(endpoint, **call_params)
-        results = data.get("results", [])
-        all_results.extend(results)
+    Accumulates results across pages using cursor-based pagination.
+    Respects the optional limit parameter to cap total results.
+    """
+    return [
+        item
+        for page in iter_pages(endpoint, limit, page_size, **params)
+        for item in page
+    ]
 
-        # Stop if we've hit the requested limit.
-        if limit and len(all_results) >= limit:
-            all_results = all_results[:limit]
-            break
 
-        # Stop if no more data.
-        if not data.get("moreDataAvailable", False):
-            break
+def _cache_path(endpoint: str, params: dict) -> str:
+    """Return the on-disk cache file for an endpoint and its params."""
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache",
+    )
+    # Include the credentials so different Ashby orgs never share entries.
+    key = json.dumps([_auth_header(), endpoint, params], sort_keys=True)
+    digest = hashlib.sha256(key.encode()).hexdigest()
+    return os.path.join(base, "ashby-mcp", f"{digest}.json")
+
+
+def cached_paginate(
+    endpoint: str, ttl_seconds: int, use_cache: bool = True, **params,
+) -> list:
+    """Paginate through an endpoint, reusing a cached copy within the TTL.
+
+    Results are stored under $XDG_CACHE_HOME/ashby-mcp/ keyed by endpoint
+    and params. With use_cache=False the cached copy is ignored, but the
+    fresh results still replace it.
+    """
+    path = _cache_path(endpoint, params)
 
-        cursor = data.get("nextCursor")
-        if not cursor:
-            break
+    if use_cache:
+        try:
+            if time.time() - os.path.getmtime(path) < ttl_seconds:
+                with open(path, "rb") as f:
+                    return _loads(f.read())
+        except (OSError, ValueError):
+            pass
 
-        # Rate-limit politeness.
-        time.sleep(0.2)
+    results = paginate(endpoint, **params)
 
-    return all_results
+    # Write atomically so concurrent runs never read a partial file.
+    # Caching is best-effort; a read-only home just means no cache.
+    try:
+        cache_dir = os.path.dirname(path)
+        os.makedirs(cache_dir, mode=0o700, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+        with os.fdopen(fd, "w") as f:
+            json.dump(results, f)
+        os.replace(tmp_path, path)
+    except OSError:
+        pass
+
+    return results
 
 
 def format_output(data: Any, fmt: str = "json") -> str:
     """Format output as JSON."""
+    if orjson is not None:
+        # Non-str keys (e.g. a None stage title) are stringified like json.
+        option = orjson.OPT_NON_STR_KEYS
+        if fmt != "compact":
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, option=option, default=str).decode()
     if fmt == "compact":
         return json.dumps(data, separators=(",", ":"), default=str)
     return json.dumps(data, indent=2, default=str)
 
 
+def print_output(data: Any, fmt: str = "json"):
+    """Write formatted JSON output to stdout.
+
+    With orjson the encoded bytes go straight to the binary stream rather
+    than being decoded to str and re-encoded by print().
+    """
+    if orjson is None:
+        print(format_output(data, fmt))
+        return
+
+    option = orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS
+    if fmt != "compact":
+        option |= orjson.OPT_INDENT_2
+    sys.stdout.flush()
+    sys.stdout.buffer.write(orjson.dumps(data, option=option, default=str))
+    sys.stdout.buffer.flush()
+
+
 # =============================================================================
 # JOBS SUBCOMMAND
 # =============================================================================
@@ -162,13 +419,13 @@ def cmd_jobs(args):
     if args.id:
         # Get single job.
         data = api_call("job.info", jobId=args.id)
-        print(format_output(data.get("results", {}), args.format))
+        print_output(data.get("results", {}), args.format)
         return
 
     # List all jobs, then filter client-side by status.
     # The job.list API does not support filtering by job status (Open/Closed/Archived)
     # directly — its status param uses application statuses.
-    results = paginate("job.list", limit=None)
+    results = cached_paginate("job.list", 600, use_cache=not args.no_cache)
 
     if args.status:
         results = [j for j in results if j.get("status") == args.status]
@@ -177,7 +434,7 @@ def cmd_jobs(args):
         results = results[:args.limit]
 
     output = {"jobs": results, "total": len(results)}
-    print(format_output(output, args.format))
+    print_output(output, args.format)
 
 
 # =============================================================================
@@ -197,7 +454,7 @@ def cmd_applications(args):
             "interviewStageId": args.stage_id,
         }
         data = api_call("application.changeStage", **change_params)
-        print(format_output(data.get("results", {}), args.format))
+        print_output(data.get("results", {}), args.format)
         return
 
     # Get single application.
@@ -210,7 +467,7 @@ def cmd_applications(args):
                 "referrals",
             ]
         data = api_call("application.info", **info_params)
-        print(format_output(data.get("results", {}), args.format))
+        print_output(data.get("results", {}), args.format)
         return
 
     # List applications with optional filters.
@@ -220,27 +477,46 @@ def cmd_applications(args):
     if args.status:
         params["status"] = args.status
 
-    results = paginate("application.list", limit=args.limit, **params)
-
     # Enrich mode: fetch full details for each application (slower but gives
     # form submissions, resume handles, and referrals for screening).
     if args.enrich:
-        enriched = []
-        for app in results:
-            app_id = app.get("id")
-            if not app_id:
-                continue
+        def fetch_detail(app: dict) -> dict:
             detail = api_call(
                 "application.info",
-                applicationId=app_id,
+                applicationId=app["id"],
                 expand=["applicationFormSubmissions", "openings", "referrals"],
             )
-            enriched.append(detail.get("results", app))
-            time.sleep(0.2)
-        results = enriched
+            return detail.get("results", app)
+
+        # Start detail fetches as each listing page arrives, while the next
+        # page is still loading, and collect the previous page's details in
+        # the meantime. A failed fetch thus stops the listing within a page,
+        # and queued fetches are cancelled rather than run.
+        pool = ThreadPoolExecutor(max_workers=MAX_WORKERS)
+        try:
+            results = []
+            pending = []
+            for page in iter_pages(
+                "application.list", limit=args.limit,
+                page_size=args.page_size, **params,
+            ):
+                results.extend(f.result() for f in pending)
+                pending = [
+                    pool.submit(fetch_detail, app)
+                    for app in page
+                    if app.get("id")
+                ]
+            results.extend(f.result() for f in pending)
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
+    else:
+        results = paginate(
+            "application.list", limit=args.limit,
+            page_size=args.page_size, **params,
+        )
 
     output = {"applications": results, "total": len(results)}
-    print(format_output(output, args.format))
+    print_output(output, args.format)
 
 
 # =============================================================================
@@ -253,7 +529,7 @@ def cmd_candidates(args):
     # Get single candidate.
     if args.id:
         data = api_call("candidate.info", candidateId=args.id)
-        print(format_output(data.get("results", {}), args.format))
+        print_output(data.get("results", {}), args.format)
         return
 
     # Search by email or name.
@@ -266,13 +542,15 @@ def cmd_candidates(args):
         data = api_call("candidate.search", **search_params)
         results = data.get("results", [])
         output = {"candidates": results, "total": len(results)}
-        print(format_output(output, args.format))
+        print_output(output, args.format)
         return
 
     # List all candidates.
-    results = paginate("candidate.list", limit=args.limit)
+    results = paginate(
+        "candidate.list", limit=args.limit, page_size=args.page_size,
+    )
     output = {"candidates": results, "total": len(results)}
-    print(format_output(output, args.format))
+    print_output(output, args.format)
 
 
 # =============================================================================
@@ -292,13 +570,15 @@ def cmd_tags(args):
             candidateId=args.candidate_id,
             tagId=args.tag_id,
         )
-        print(format_output(data.get("results", {}), args.format))
+        print_output(data.get("results", {}), args.format)
         return
 
     # List all tags.
-    results = paginate("candidateTag.list")
+    results = cached_paginate(
+        "candidateTag.list", 3600, use_cache=not args.no_cache,
+    )
     output = {"tags": results, "total": len(results)}
-    print(format_output(output, args.format))
+    print_output(output, args.format)
 
 
 # =============================================================================
@@ -322,7 +602,7 @@ def cmd_notes(args):
     }
 
     data = api_call("candidate.createNote", **note_params)
-    print(format_output(data.get("results", {}), args.format))
+    print_output(data.get("results", {}), args.format)
 
 
 # =============================================================================
@@ -332,21 +612,38 @@ def cmd_notes(args):
 
 def cmd_dashboard(args):
     """Handle dashboard subcommand — aggregated pipeline view."""
-    # Get all jobs then filter to open ones client-side.
-    all_jobs = paginate("job.list")
+    # Get all jobs then filter to open ones client-side. job.list has no
+    # job-status filter and no documented ordering, so neither a server-side
+    # filter nor stopping early on a page of non-Open jobs is safe. The
+    # unfiltered list is the same cache entry `jobs` uses, so repeat runs
+    # skip the fetch entirely.
+    use_cache = not args.no_cache
+    all_jobs = cached_paginate("job.list", 600, use_cache=use_cache)
     jobs = [j for j in all_jobs if j.get("status") == "Open"]
 
+    # Fetch applications for every open job concurrently over the shared
+    # session; results come back in job order. On the first failure the
+    # queued fetches are cancelled rather than run.
+    pool = ThreadPoolExecutor(max_workers=MAX_WORKERS)
+    try:
+        apps_by_job = list(pool.map(
+            lambda job: cached_paginate(
+                "application.list", 60, use_cache=use_cache,
+                jobId=job.get("id"),
+            ),
+            jobs,
+        ))
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+
     job_summaries = []
     grand_total = 0
     grand_active = 0
 
-    for job in jobs:
+    for job, apps in zip(jobs, apps_by_job):
         job_id = job.get("id")
         job_title = job.get("title", "Unknown")
 
-        # Get all applications for this job.
-        apps = paginate("application.list", jobId=job_id)
-
         # Count by status and stage.
         status_counts = defaultdict(int)
         stage_counts = defaultdict(int)
@@ -376,9 +673,6 @@ def cmd_dashboard(args):
             "by_stage": dict(stage_counts),
         })
 
-        # Rate-limit politeness between jobs.
-        time.sleep(0.2)
-
     # Sort by total applications descending.
     job_summaries.sort(key=lambda j: j["total_applications"], reverse=True)
 
@@ -394,35 +688,40 @@ def cmd_dashboard(args):
     if args.format == "markdown":
         _print_dashboard_markdown(output)
     else:
-        print(format_output(output, args.format))
+        print_output(output, args.format)
 
 
 def _print_dashboard_markdown(data: dict):
     """Print dashboard in markdown table format."""
     totals = data["totals"]
-    print(f"# Ashby Pipeline Dashboard")
-    print(f"\n**{totals['jobs']} open jobs** | "
-          f"**{totals['applications']} total applications** | "
-          f"**{totals['active']} active**\n")
 
-    print("| Job | Active | Archived | Hired | Total |")
-    print("|-----|--------|----------|-------|-------|")
+    # Accumulate lines and emit them with a single write.
+    lines = [
+        "# Ashby Pipeline Dashboard",
+        f"\n**{totals['jobs']} open jobs** | "
+        f"**{totals['applications']} total applications** | "
+        f"**{totals['active']} active**\n",
+        "| Job | Active | Archived | Hired | Total |",
+        "|-----|--------|----------|-------|-------|",
+    ]
     for job in data["jobs"]:
-        print(f"| {job['title']} | {job['active']} | "
-              f"{job['archived']} | {job['hired']} | "
-              f"{job['total_applications']} |")
+        lines.append(f"| {job['title']} | {job['active']} | "
+                     f"{job['archived']} | {job['hired']} | "
+                     f"{job['total_applications']} |")
 
-    print()
+    lines.append("")
     for job in data["jobs"]:
         if job["by_stage"]:
-            print(f"### {job['title']}")
+            lines.append(f"### {job['title']}")
             for stage, count in sorted(
                 job["by_stage"].items(),
                 key=lambda x: x[1],
                 reverse=True,
             ):
-                print(f"- {stage}: {count}")
-            print()
+                lines.append(f"- {stage}: {count}")
+            lines.append("")
+
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 # =============================================================================
@@ -430,15 +729,37 @@ def _print_dashboard_markdown(data: dict):
 # =============================================================================
 
 
+def _positive_int(value: str) -> int:
+    """argparse type for counts that must be at least 1."""
+    try:
+        n = int(value)
+    except ValueError:
+        n = 0
+    if n < 1:
+        raise argparse.ArgumentTypeError(
+            f"must be a positive integer, got {value!r}"
+        )
+    return n
+
+
 def main():
-    # Shared parent parser for --format flag so it works in any position.
+    # Shared parent parser for global flags, accepted both before and after
+    # the subcommand. Their defaults are suppressed so the subcommand parser
+    # cannot overwrite a value given before it; real defaults are applied
+    # after parsing.
     format_parser = argparse.ArgumentParser(add_help=False)
     format_parser.add_argument(
         "--format", "-f",
         choices=["json", "compact", "markdown"],
-        default="json",
+        default=argparse.SUPPRESS,
         help="Output format (default: json)",
     )
+    format_parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        default=argparse.SUPPRESS,
+        help="Ignore cached job, tag, and dashboard data and fetch fresh",
+    )
 
     parser = argparse.ArgumentParser(
         description="Ashby ATS API client",
@@ -460,7 +781,9 @@ def main():
         choices=["Open", "Closed", "Archived", "Draft"],
         help="Filter by job status",
     )
-    jobs_parser.add_argument("--limit", type=int, help="Max results to return")
+    jobs_parser.add_argument(
+        "--limit", type=_positive_int, help="Max results to return",
+    )
     jobs_parser.set_defaults(func=cmd_jobs)
 
     # -------------------------------------------------------------------------
@@ -482,7 +805,13 @@ def main():
         action="store_true",
         help="Expand application form submissions, openings, and referrals",
     )
-    apps_parser.add_argument("--limit", type=int, help="Max results to return")
+    apps_parser.add_argument(
+        "--limit", type=_positive_int, help="Max results to return",
+    )
+    apps_parser.add_argument(
+        "--page-size", type=_positive_int, default=MAX_PAGE_SIZE,
+        help=f"Records per API page (max {MAX_PAGE_SIZE})",
+    )
     apps_parser.add_argument(
         "--enrich",
         action="store_true",
@@ -508,7 +837,13 @@ def main():
     cand_parser.add_argument("--id", help="Get a specific candidate by ID")
     cand_parser.add_argument("--search-email", help="Search candidates by email")
     cand_parser.add_argument("--search-name", help="Search candidates by name")
-    cand_parser.add_argument("--limit", type=int, help="Max results to return")
+    cand_parser.add_argument(
+        "--limit", type=_positive_int, help="Max results to return",
+    )
+    cand_parser.add_argument(
+        "--page-size", type=_positive_int, default=MAX_PAGE_SIZE,
+        help=f"Records per API page (max {MAX_PAGE_SIZE})",
+    )
     cand_parser.set_defaults(func=cmd_candidates)
 
     # -------------------------------------------------------------------------
@@ -551,6 +886,8 @@ def main():
 
     # Parse and execute.
     args = parser.parse_args()
+    args.format = getattr(args, "format", "json")
+    args.no_cache = getattr(args, "no_cache", False)
 
     if not args.command:
         parser.print_help()
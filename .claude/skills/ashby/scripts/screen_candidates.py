@@ -15,17 +15,47 @@ Usage:
 
     # Fetch and screen a single application:
     python screen_candidates.py --application-id <id>
+
+    # Fetch and screen several applications:
+    python screen_candidates.py --application-ids <id1>,<id2>,<id3>
 """
 
 import argparse
+import bisect
+import functools
+import heapq
 import json
+import mmap
+import os
+import stat
 import sys
-from datetime import datetime, timezone
-from pathlib import Path
-from typing import Any
+from collections import Counter, defaultdict
+from contextlib import ExitStack, contextmanager
+from itertools import islice
+from typing import Any, BinaryIO, Iterable, Iterator, Optional
+
+# Modules only needed by some code paths (hashlib, datetime, sqlite3,
+# concurrent futures, and the optional orjson, pyahocorasick and ijson) are
+# imported where they are used, and derived tables such as the keyword
+# automaton are built on first use, keeping startup fast for interactive
+# and --help invocations.
 
 # Allow importing api_call from the sibling ashby_client module.
-sys.path.insert(0, str(Path(__file__).resolve().parent))
+sys.path.insert(0, os.path.dirname(os.path.realpath(__file__)))
+
+
+@functools.lru_cache(maxsize=None)
+def _orjson():
+    """Return the orjson module, or None when it is not installed.
+
+    orjson is optional; it parses and serializes large batches several
+    times faster than the stdlib json module.
+    """
+    try:
+        import orjson
+    except ImportError:
+        return None
+    return orjson
 
 
 # =============================================================================
@@ -172,6 +202,50 @@ CRITERIA = {
 }
 
 
+# CRITERIA with keywords lowercased once at import rather than per candidate.
+_CRITERIA_LC = {
+    key: {
+        "weight": config["weight"],
+        "label": config["label"],
+        "keywords_lc": tuple(kw.lower() for kw in config["keywords"]),
+    }
+    for key, config in CRITERIA.items()
+}
+
+# Keyword matches needed for a category to earn its full weight.
+_SATURATION = 3
+
+# Highest achievable total score; CRITERIA is fixed, so compute it once.
+_MAX_POSSIBLE = round(sum(c["weight"] for c in CRITERIA.values()), 2)
+
+
+@functools.lru_cache(maxsize=None)
+def _automaton() -> Optional["ahocorasick.Automaton"]:
+    """Return an Aho-Corasick automaton over all CRITERIA keywords.
+
+    pyahocorasick is optional; it finds every keyword in a single pass
+    over the text instead of one substring scan per keyword. The
+    automaton is built on first use. Each lowercased keyword maps to the
+    (category, index) positions it occupies so matches can be reported in
+    CRITERIA order. Returns None when pyahocorasick is not installed.
+    """
+    try:
+        import ahocorasick
+    except ImportError:
+        return None
+
+    positions = defaultdict(list)
+    for key, config in _CRITERIA_LC.items():
+        for i, kw in enumerate(config["keywords_lc"]):
+            positions[kw].append((key, i))
+
+    automaton = ahocorasick.Automaton()
+    for kw, locs in positions.items():
+        automaton.add_word(kw, tuple(locs))
+    automaton.make_automaton()
+    return automaton
+
+
 # =============================================================================
 # TEXT EXTRACTION
 # =============================================================================
@@ -180,28 +254,29 @@ CRITERIA = {
 def extract_text(application: dict) -> str:
     """Extract all searchable text from an application record.
 
-    Recursively walks the application structure and concatenates all
-    string values into a single searchable blob.
+    Walks the application structure and joins all non-empty string values
+    into a single searchable blob, one field per line so keywords cannot
+    span unrelated fields.
     """
     parts = []
 
+    def _add(value: Any):
+        if value:
+            parts.append(str(value))
+
     # Candidate info.
     candidate = application.get("candidate", {})
     if candidate:
-        parts.append(candidate.get("name", ""))
+        _add(candidate.get("name"))
         email = candidate.get("primaryEmailAddress", {})
         if email:
-            parts.append(email.get("value", ""))
+            _add(email.get("value"))
 
     # Custom fields.
     for field in application.get("customFields", []):
-        title = field.get("title", "")
-        value = field.get("value", "")
-        label = field.get("valueLabel", "")
-        parts.append(str(title))
-        parts.append(str(value))
-        if label:
-            parts.append(str(label))
+        _add(field.get("title"))
+        _add(field.get("value"))
+        _add(field.get("valueLabel"))
 
     # Application form submissions (expanded).
     for submission in application.get("applicationFormSubmissions", []):
@@ -210,31 +285,38 @@ def extract_text(application: dict) -> str:
     # Source info.
     source = application.get("source", {})
     if source:
-        parts.append(source.get("title", ""))
+        _add(source.get("title"))
 
     # Resume filename (content not available via API).
     resume = application.get("resumeFileHandle", {})
     if resume:
-        parts.append(resume.get("name", ""))
+        _add(resume.get("name"))
 
     # Job info.
     job = application.get("job", {})
     if job:
-        parts.append(job.get("title", ""))
+        _add(job.get("title"))
+
+    return "\n".join(parts)
 
-    return " ".join(filter(None, parts))
 
+def _extract_form_text(root: Any, parts: list):
+    """Extract string values from form submission data.
 
-def _extract_form_text(obj: Any, parts: list):
-    """Recursively extract string values from form submission data."""
-    if isinstance(obj, str):
-        parts.append(obj)
-    elif isinstance(obj, dict):
-        for v in obj.values():
-            _extract_form_text(v, parts)
-    elif isinstance(obj, list):
-        for item in obj:
-            _extract_form_text(item, parts)
+    Walks nested dicts and lists with an explicit stack, so arbitrarily
+    deep submissions cannot hit the recursion limit. Children are pushed
+    in reverse to keep document order.
+    """
+    stack = [root]
+    while stack:
+        obj = stack.pop()
+        if isinstance(obj, str):
+            if obj:
+                parts.append(obj)
+        elif isinstance(obj, dict):
+            stack.extend(reversed(obj.values()))
+        elif isinstance(obj, list):
+            stack.extend(reversed(obj))
 
 
 # =============================================================================
@@ -250,17 +332,38 @@ def score_candidate(text: str) -> dict:
     text_lower = text.lower()
     categories = {}
     total = 0.0
-    max_possible = 0.0
 
-    for key, config in CRITERIA.items():
-        weight = config["weight"]
-        keywords = config["keywords"]
+    # Single pass over the text collecting matched keyword indices.
+    automaton = _automaton()
+    if automaton is not None:
+        found = defaultdict(set)
+        for _, locs in automaton.iter(text_lower):
+            for key, i in locs:
+                found[key].add(i)
 
-        matched = [kw for kw in keywords if kw.lower() in text_lower]
+    for key, config in _CRITERIA_LC.items():
+        weight = config["weight"]
+        keywords = config["keywords_lc"]
+
+        # Matching stops at the saturation point: further keywords in a
+        # category cannot raise its score.
+        if automaton is not None:
+            hits = sorted(found[key])
+            matched = [keywords[i] for i in hits[:_SATURATION]]
+            capped = len(hits) > _SATURATION
+        else:
+            matched = []
+            capped = False
+            for kw in keywords:
+                if kw in text_lower:
+                    if len(matched) == _SATURATION:
+                        capped = True
+                        break
+                    matched.append(kw)
 
         # Score: min(matched / 3, 1.0) * weight.
         # Three or more keyword matches in a category earns full score.
-        raw = min(len(matched) / 3.0, 1.0)
+        raw = min(len(matched) / _SATURATION, 1.0)
         category_score = round(raw * weight, 2)
 
         categories[key] = {
@@ -269,31 +372,146 @@ def score_candidate(text: str) -> dict:
             "max": weight,
             "matched": matched,
             "match_count": len(matched),
+            "match_count_capped": capped,
         }
 
         total += category_score
-        max_possible += weight
 
-    pct = round(total / max_possible * 100, 1) if max_possible > 0 else 0.0
+    pct = round(total / _MAX_POSSIBLE * 100, 1) if _MAX_POSSIBLE > 0 else 0.0
 
     return {
         "total_score": round(total, 2),
-        "max_possible": round(max_possible, 2),
+        "max_possible": _MAX_POSSIBLE,
         "pct": pct,
         "categories": categories,
     }
 
 
+# Lower bound (inclusive) of each tier above no_signal, in ascending order.
+_TIER_THRESHOLDS = (15, 35, 60)
+_TIER_NAMES = ("no_signal", "weak", "moderate", "strong")
+
+
+def _tier_index(pct: float) -> int:
+    """Return the index into _TIER_NAMES for a score percentage."""
+    return bisect.bisect_right(_TIER_THRESHOLDS, pct)
+
+
 def classify_tier(pct: float) -> str:
     """Classify candidate into a tier based on score percentage."""
-    if pct >= 60:
-        return "strong"
-    elif pct >= 35:
-        return "moderate"
-    elif pct >= 15:
-        return "weak"
-    else:
-        return "no_signal"
+    return _TIER_NAMES[_tier_index(pct)]
+
+
+# =============================================================================
+# SCORE CACHE
+# =============================================================================
+
+# Bump when scoring logic changes in a way CRITERIA alone does not capture.
+_SCORE_VERSION = 1
+
+@functools.lru_cache(maxsize=None)
+def _criteria_tag() -> str:
+    """Return a hash of the criteria, computed once on first use.
+
+    Tying cache keys to the criteria means editing keywords or weights
+    invalidates every stored score.
+    """
+    from hashlib import blake2b
+
+    data = json.dumps([_SCORE_VERSION, CRITERIA], sort_keys=True).encode()
+    return blake2b(data, digest_size=8).hexdigest()
+
+
+def _score_key(text: str) -> str:
+    """Return the score cache key for a candidate's extracted text."""
+    from hashlib import blake2b
+
+    # surrogatepass: json can decode lone surrogates like "\ud800" into text.
+    data = text.encode("utf-8", "surrogatepass")
+    digest = blake2b(data, digest_size=16).hexdigest()
+    return f"{_criteria_tag()}:{digest}"
+
+
+class _ScoreCache:
+    """Best-effort persistent score cache keyed by _score_key.
+
+    Scores are stored as JSON in an SQLite database, whose locking keeps
+    concurrent screening runs consistent. Any failure to open, read or
+    write the database (read-only home, a corrupt file, a lock held past
+    the timeout) is treated as a miss rather than an error. A path of
+    None gives a disabled cache that never touches disk.
+    """
+
+    def __init__(self, path: Optional[str]):
+        import sqlite3
+
+        self._errors = (sqlite3.Error, ValueError)
+        self._db = None
+        if path is None:
+            return
+
+        try:
+            os.makedirs(os.path.dirname(path), mode=0o700, exist_ok=True)
+            self._db = sqlite3.connect(path, timeout=5)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS scores "
+                "(key TEXT PRIMARY KEY, score TEXT NOT NULL)"
+            )
+        except (OSError, *self._errors):
+            self.close()
+
+    def get(self, key: str) -> Optional[dict]:
+        """Return the cached score for key, or None on a miss."""
+        if self._db is None:
+            return None
+        try:
+            row = self._db.execute(
+                "SELECT score FROM scores WHERE key = ?", (key,),
+            ).fetchone()
+            return _parse_document(row[0]) if row else None
+        except self._errors:
+            return None
+
+    def put_many(self, scores: dict) -> None:
+        """Store scores keyed by _score_key in a single transaction."""
+        if self._db is None or not scores:
+            return
+        try:
+            with self._db:
+                self._db.executemany(
+                    "INSERT OR REPLACE INTO scores VALUES (?, ?)",
+                    ((key, json.dumps(score)) for key, score in scores.items()),
+                )
+        except self._errors:
+            pass
+
+    def close(self) -> None:
+        """Close the database connection, if open."""
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+
+
+@contextmanager
+def _score_cache(enabled: bool = True) -> Iterator[_ScoreCache]:
+    """Open the persistent score cache for one screening run.
+
+    Scores live under $XDG_CACHE_HOME/ashby-mcp/ so that re-screening an
+    unchanged candidate costs one hash and one lookup. When not enabled
+    the cache is neither read nor written.
+    """
+    path = None
+    if enabled:
+        base = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+            os.path.expanduser("~"), ".cache",
+        )
+        path = os.path.join(base, "ashby-mcp", "screen_scores.sqlite3")
+
+    cache = _ScoreCache(path)
+    try:
+        yield cache
+    finally:
+        cache.close()
 
 
 # =============================================================================
@@ -301,84 +519,372 @@ def classify_tier(pct: float) -> str:
 # =============================================================================
 
 
-def screen_applications(applications: list) -> dict:
-    """Screen a list of application records and return ranked results."""
-    screened = []
+# Below this many applications a process pool costs more than it saves.
+_PARALLEL_MIN_BATCH = 32
 
-    for app in applications:
-        text = extract_text(app)
-        score = score_candidate(text)
-        tier = classify_tier(score["pct"])
 
-        candidate = app.get("candidate", {})
-        job = app.get("job", {})
-        stage = app.get("currentInterviewStage", {})
+def _candidate_row(app: dict) -> dict:
+    """Build the identifying fields of an application's screening result."""
+    get = app.get
+    candidate = get("candidate") or {}
+    job = get("job") or {}
+    stage = get("currentInterviewStage")
 
-        screened.append({
-            "candidate_id": candidate.get("id", ""),
-            "candidate_name": candidate.get("name", "Unknown"),
-            "application_id": app.get("id", ""),
-            "job_title": job.get("title", "Unknown"),
-            "stage": stage.get("title", "Unknown") if stage else "Unknown",
-            "status": app.get("status", "Unknown"),
-            "tier": tier,
-            "score": score,
-        })
+    return {
+        "candidate_id": candidate.get("id", ""),
+        "candidate_name": candidate.get("name", "Unknown"),
+        "application_id": get("id", ""),
+        "job_title": job.get("title", "Unknown"),
+        "stage": stage.get("title", "Unknown") if stage else "Unknown",
+        "status": get("status", "Unknown"),
+    }
 
-    # Sort by score descending.
-    screened.sort(key=lambda x: x["score"]["total_score"], reverse=True)
 
-    # Summary counts.
-    tier_counts = {"strong": 0, "moderate": 0, "weak": 0, "no_signal": 0}
-    for s in screened:
-        tier_counts[s["tier"]] += 1
+def screen_applications(
+    applications: Iterable[dict],
+    workers: Optional[int] = None,
+    use_cache: bool = True,
+    top_k: Optional[int] = None,
+    min_tier: Optional[str] = None,
+    screened_at: Optional[str] = None,
+) -> dict:
+    """Screen application records and return ranked results.
+
+    Applications are consumed in a single pass, so a streaming iterator
+    never needs to be held in memory in full. Scores for unchanged
+    candidate text are reused from the score cache; with use_cache=False
+    they are recomputed and the cache is not touched. With workers > 1,
+    batches larger than _PARALLEL_MIN_BATCH are scored across a process
+    pool, since keyword matching is CPU-bound. With top_k and min_tier,
+    only the top_k highest scorers at or above min_tier are returned; the
+    summary still covers all. screened_at pins the reported timestamp;
+    by default the current UTC time is used.
+    """
+    rows = []
+    scores = {}
+    misses = {}
+    add_row = rows.append
+
+    with _score_cache(use_cache) as cache:
+        for app in applications:
+            text = extract_text(app)
+            key = _score_key(text)
+            add_row((_candidate_row(app), key))
+
+            # Look each distinct text up once; keep text only for misses.
+            if key in scores or key in misses:
+                continue
+            hit = cache.get(key)
+            if hit is not None:
+                scores[key] = hit
+            else:
+                misses[key] = text
+
+        if workers and workers > 1 and len(misses) > _PARALLEL_MIN_BATCH:
+            chunksize = max(1, len(misses) // (workers * 4))
+            from concurrent.futures import ProcessPoolExecutor
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                fresh = list(pool.map(
+                    score_candidate, misses.values(), chunksize=chunksize,
+                ))
+        else:
+            fresh = [score_candidate(text) for text in misses.values()]
+
+        fresh = dict(zip(misses, fresh))
+        scores.update(fresh)
+        cache.put_many(fresh)
+
+    # Rank on flat columns of totals and tier indices; full result dicts
+    # are only assembled afterwards, in ranked order.
+    row_scores = [scores[key] for _, key in rows]
+    totals = [score["total_score"] for score in row_scores]
+    tier_ids = [_tier_index(score["pct"]) for score in row_scores]
+
+    # Drop rows below the minimum tier by comparing tier indices.
+    candidates = range(len(rows))
+    if min_tier:
+        min_level = _TIER_NAMES.index(min_tier)
+        candidates = [i for i in candidates if tier_ids[i] >= min_level]
+
+    # Sort by score descending (stable, so ties keep input order). A
+    # bounded heap avoids sorting everything when only the top few matter.
+    if top_k is not None:
+        order = heapq.nlargest(top_k, candidates, key=totals.__getitem__)
+    else:
+        order = sorted(candidates, key=totals.__getitem__, reverse=True)
+
+    # The result count is known up front, so fill a pre-sized list.
+    screened = [None] * len(order)
+    for pos, i in enumerate(order):
+        row = rows[i][0]
+        row["tier"] = _TIER_NAMES[tier_ids[i]]
+        row["score"] = row_scores[i]
+        screened[pos] = row
+
+    # Summary counts, strongest tier first.
+    counts = Counter(tier_ids)
+    tier_counts = {
+        _TIER_NAMES[t]: counts[t] for t in reversed(range(len(_TIER_NAMES)))
+    }
 
     return {
-        "screened_at": datetime.now(timezone.utc).isoformat(),
+        "screened_at": screened_at if screened_at is not None else _utc_now(),
         "total_candidates": len(screened),
         "summary": tier_counts,
         "candidates": screened,
     }
 
 
+def _utc_now() -> str:
+    """Return the current UTC time as an ISO 8601 string."""
+    from datetime import datetime, timezone
+    return datetime.now(timezone.utc).isoformat()
+
+
+# =============================================================================
+# INPUT
+# =============================================================================
+
+
+def fetch_applications(app_ids: list) -> list:
+    """Fetch expanded application records from the Ashby API.
+
+    Ashby has no bulk lookup by ID, so the application.info calls run
+    concurrently over ashby_client's shared session and rate limiter.
+    Results keep the order of app_ids.
+    """
+    from ashby_client import MAX_WORKERS, api_call
+
+    def fetch(app_id: str) -> dict:
+        data = api_call(
+            "application.info",
+            applicationId=app_id,
+            expand=["applicationFormSubmissions", "openings", "referrals"],
+        )
+        return data.get("results", {})
+
+    from concurrent.futures import ThreadPoolExecutor
+
+    # On the first failure, cancel queued fetches rather than run them.
+    pool = ThreadPoolExecutor(max_workers=MAX_WORKERS)
+    try:
+        return list(pool.map(fetch, app_ids))
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+# Inputs below this size are parsed by orjson in one go (regular files
+# from a read-only memory map); larger ones are streamed with ijson to
+# bound memory use.
+_MMAP_MAX_BYTES = 100 * 1024 * 1024
+
+
+def load_applications(f: BinaryIO) -> Iterable[dict]:
+    """Read application records from a binary JSON stream.
+
+    Accepts a bare [...] list, an {"applications": [...]} wrapper, or a
+    single application object. With orjson installed, inputs under
+    _MMAP_MAX_BYTES are parsed whole: regular files straight from a
+    read-only memory map, pipes after reading them in. With ijson
+    installed, larger inputs are parsed and yielded one record at a time
+    instead of loading the whole document.
+    """
+    orjson = _orjson()
+    size = _regular_file_size(f)
+    if orjson is not None and 0 < size < _MMAP_MAX_BYTES:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            with memoryview(mm) as view:
+                return _unwrap_applications(_parse_document(view))
+
+    # A pipe's size is unknown up front: read up to the limit and parse
+    # in one go if the input ended within it.
+    head = b""
+    if orjson is not None and size < 0:
+        head = f.read(_MMAP_MAX_BYTES + 1)
+        if len(head) <= _MMAP_MAX_BYTES:
+            return _unwrap_applications(_parse_document(head))
+
+    # ijson is optional; it lets large inputs be screened record by record.
+    try:
+        import ijson  # noqa: F401
+    except ImportError:
+        return _unwrap_applications(_parse_document(head + f.read()))
+
+    return _stream_applications(_PrefixedReader(head, f) if head else f)
+
+
+def _parse_document(data: Any) -> Any:
+    """Parse a whole JSON document from str, bytes or a buffer.
+
+    orjson rejects lone surrogate escapes such as "\\ud800" that the
+    stdlib json module accepts, so such documents fall back to json.
+    """
+    orjson = _orjson()
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    if not isinstance(data, (str, bytes)):
+        data = bytes(data)
+    return json.loads(data)
+
+
+class _PrefixedReader:
+    """Binary reader that returns already-read bytes before the rest of f."""
+
+    def __init__(self, prefix: bytes, f: BinaryIO):
+        self._prefix = prefix
+        self._f = f
+
+    def read(self, n: int = -1) -> bytes:
+        if not self._prefix:
+            return self._f.read(n)
+        if n is None or n < 0:
+            data, self._prefix = self._prefix + self._f.read(), b""
+        else:
+            data, self._prefix = self._prefix[:n], self._prefix[n:]
+        return data
+
+
+def _regular_file_size(f: BinaryIO) -> int:
+    """Return the size of f if it is backed by a regular file, else -1."""
+    try:
+        st = os.fstat(f.fileno())
+    except (AttributeError, OSError, ValueError):
+        return -1
+    return st.st_size if stat.S_ISREG(st.st_mode) else -1
+
+
+def _unwrap_applications(raw: Any) -> list:
+    """Return the application list from a fully parsed JSON document."""
+    # Handle both {"applications": [...]} and bare [...] formats.
+    if isinstance(raw, list):
+        return raw
+    return raw.get("applications", [raw])
+
+
+def _stream_applications(f: BinaryIO) -> Iterator[dict]:
+    """Yield application records from a JSON stream using ijson."""
+    import ijson
+
+    events = ijson.parse(f, use_float=True)
+    # Builds the document in case it turns out to be a single application.
+    builder = ijson.ObjectBuilder()
+
+    for prefix, event, value in events:
+        if prefix == "" and event == "start_array":
+            yield from ijson.items(events, "item")
+            return
+        if prefix == "" and event == "map_key" and value == "applications":
+            yield from ijson.items(events, "applications.item")
+            return
+        builder.event(event, value)
+
+    yield builder.value
+
+
 # =============================================================================
 # OUTPUT FORMATTING
 # =============================================================================
 
 
+# Markdown marker shown before each tier name.
+_TIER_EMOJI = {
+    "strong": "+++",
+    "moderate": "++",
+    "weak": "+",
+    "no_signal": "-",
+}
+
+
 def print_markdown(results: dict):
     """Print screening results as markdown."""
     summary = results["summary"]
     total = results["total_candidates"]
 
-    print(f"# Candidate Screening Results")
-    print(f"\n**{total} candidates screened** | "
-          f"Strong: {summary['strong']} | "
-          f"Moderate: {summary['moderate']} | "
-          f"Weak: {summary['weak']} | "
-          f"No Signal: {summary['no_signal']}\n")
-
-    print("| Tier | Candidate | Job | Stage | Score | Top Matches |")
-    print("|------|-----------|-----|-------|-------|-------------|")
+    # Accumulate lines and emit them with a single write.
+    lines = [
+        "# Candidate Screening Results",
+        f"\n**{total} candidates screened** | "
+        f"Strong: {summary['strong']} | "
+        f"Moderate: {summary['moderate']} | "
+        f"Weak: {summary['weak']} | "
+        f"No Signal: {summary['no_signal']}\n",
+        "| Tier | Candidate | Job | Stage | Score | Top Matches |",
+        "|------|-----------|-----|-------|-------|-------------|",
+    ]
 
     for c in results["candidates"]:
-        # Collect top matched keywords across categories.
-        top_matches = []
-        for cat_data in c["score"]["categories"].values():
-            if cat_data["matched"]:
-                top_matches.extend(cat_data["matched"][:2])
+        # Collect top matched keywords across categories, stopping at six.
+        top_matches = islice(
+            (
+                m
+                for cat_data in c["score"]["categories"].values()
+                for m in cat_data["matched"][:2]
+            ),
+            6,
+        )
+
+        matches_str = ", ".join(top_matches) or "-"
+        tier_emoji = _TIER_EMOJI[c["tier"]]
+
+        lines.append(f"| {tier_emoji} {c['tier']} | {c['candidate_name']} | "
+                     f"{c['job_title']} | {c['stage']} | "
+                     f"{c['score']['pct']}% | {matches_str} |")
 
-        matches_str = ", ".join(top_matches[:6]) if top_matches else "-"
-        tier_emoji = {
-            "strong": "+++",
-            "moderate": "++",
-            "weak": "+",
-            "no_signal": "-",
-        }[c["tier"]]
+    sys.stdout.write("\n".join(lines) + "\n")
 
-        print(f"| {tier_emoji} {c['tier']} | {c['candidate_name']} | "
-              f"{c['job_title']} | {c['stage']} | "
-              f"{c['score']['pct']}% | {matches_str} |")
+
+def _dumps(obj: Any, indent: bool = False) -> bytes:
+    """Serialize obj to JSON bytes, with orjson when available.
+
+    As with json.dumps, non-str keys are stringified. orjson refuses
+    strings holding lone surrogates, which JSON input can produce, so
+    those fall back to json, which escapes them.
+    """
+    orjson = _orjson()
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        try:
+            return orjson.dumps(obj, option=option, default=str)
+        except orjson.JSONEncodeError:
+            pass
+    if indent:
+        return json.dumps(obj, indent=2, default=str).encode()
+    return json.dumps(obj, separators=(",", ":"), default=str).encode()
+
+
+def print_json(results: dict, fmt: str = "json"):
+    """Print screening results as indented or compact JSON."""
+    # Write encoded bytes directly rather than round-tripping via str.
+    sys.stdout.flush()
+    sys.stdout.buffer.write(_dumps(results, indent=fmt != "compact") + b"\n")
+    sys.stdout.buffer.flush()
+
+
+def print_ndjson(results: dict):
+    """Print screening results as newline-delimited JSON.
+
+    The first line is a {"_meta": {...}} header with the run summary;
+    each following line is one candidate, in ranked order.
+    """
+    meta = {
+        "_meta": {
+            "screened_at": results["screened_at"],
+            "total_candidates": results["total_candidates"],
+            "summary": results["summary"],
+        },
+    }
+    lines = [_dumps(meta)]
+    lines.extend(_dumps(c) for c in results["candidates"])
+    lines.append(b"")
+
+    sys.stdout.flush()
+    sys.stdout.buffer.write(b"\n".join(lines))
+    sys.stdout.buffer.flush()
 
 
 # =============================================================================
@@ -386,6 +892,19 @@ def print_markdown(results: dict):
 # =============================================================================
 
 
+def _positive_int(value: str) -> int:
+    """argparse type for counts that must be at least 1."""
+    try:
+        n = int(value)
+    except ValueError:
+        n = 0
+    if n < 1:
+        raise argparse.ArgumentTypeError(
+            f"must be a positive integer, got {value!r}"
+        )
+    return n
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Screen Ashby candidates against Lightning Labs hiring criteria",
@@ -399,66 +918,74 @@ def main():
         "--application-id",
         help="Fetch and screen a single application by ID (calls Ashby API)",
     )
+    parser.add_argument(
+        "--application-ids",
+        help="Fetch and screen several applications (comma-separated IDs)",
+    )
     parser.add_argument(
         "--min-tier",
-        choices=["strong", "moderate", "weak", "no_signal"],
+        choices=list(reversed(_TIER_NAMES)),
         help="Only show candidates at or above this tier",
     )
+    parser.add_argument(
+        "--top",
+        type=_positive_int,
+        metavar="N",
+        help="Only show the N highest-scoring candidates",
+    )
+    parser.add_argument(
+        "--parallel",
+        action="store_true",
+        help="Score large batches across all CPU cores",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Ignore cached scores and rescore every candidate",
+    )
     parser.add_argument(
         "--format", "-f",
-        choices=["json", "compact", "markdown"],
+        choices=["json", "compact", "ndjson", "markdown"],
         default="json",
-        help="Output format (default: json)",
+        help="Output format (default: json); ndjson writes a summary line "
+             "then one candidate per line",
     )
 
     args = parser.parse_args()
 
-    # Determine input source.
-    if args.application_id:
-        # Fetch single application from API.
-        from ashby_client import api_call
-        data = api_call(
-            "application.info",
-            applicationId=args.application_id,
-            expand=["applicationFormSubmissions", "openings", "referrals"],
-        )
-        applications = [data.get("results", {})]
-    elif args.file:
-        with open(args.file, "r") as f:
-            raw = json.load(f)
-        # Handle both {"applications": [...]} and bare [...] formats.
-        if isinstance(raw, list):
-            applications = raw
-        else:
-            applications = raw.get("applications", [raw])
-    else:
-        # Read from stdin.
-        raw = json.load(sys.stdin)
-        if isinstance(raw, list):
-            applications = raw
+    # Determine input source and screen candidates. File and stdin input
+    # is consumed while screening, so it stays open until scoring is done.
+    with ExitStack() as stack:
+        if args.application_id or args.application_ids:
+            # Fetch applications from the API.
+            app_ids = [args.application_id] if args.application_id else []
+            if args.application_ids:
+                app_ids += [
+                    i.strip() for i in args.application_ids.split(",")
+                    if i.strip()
+                ]
+            applications = fetch_applications(app_ids)
+        elif args.file:
+            f = stack.enter_context(open(args.file, "rb"))
+            applications = load_applications(f)
         else:
-            applications = raw.get("applications", [raw])
-
-    # Screen candidates.
-    results = screen_applications(applications)
-
-    # Filter by minimum tier if requested.
-    if args.min_tier:
-        tier_order = {"strong": 3, "moderate": 2, "weak": 1, "no_signal": 0}
-        min_level = tier_order[args.min_tier]
-        results["candidates"] = [
-            c for c in results["candidates"]
-            if tier_order[c["tier"]] >= min_level
-        ]
-        results["total_candidates"] = len(results["candidates"])
+            applications = load_applications(sys.stdin.buffer)
+
+        results = screen_applications(
+            applications,
+            workers=os.cpu_count() if args.parallel else None,
+            use_cache=not args.no_cache,
+            top_k=args.top,
+            min_tier=args.min_tier,
+        )
 
     # Output.
     if args.format == "markdown":
         print_markdown(results)
-    elif args.format == "compact":
-        print(json.dumps(results, separators=(",", ":"), default=str))
+    elif args.format == "ndjson":
+        print_ndjson(results)
     else:
-        print(json.dumps(results, indent=2, default=str))
+        print_json(results, args.format)
 
 
 if __name__ == "__main__":
@@ -320,7 +320,9 @@ func ClassifyTier(pct float64) string {
 
 // ExtractText extracts all searchable text from an application
 // record represented as a raw JSON map. It recursively walks the
-// structure and concatenates all string values.
+// structure and joins all string values one field per line, as
+// the Python screener does, so multi-word keywords such as
+// "lightning labs" cannot match across unrelated fields.
 func ExtractText(app map[string]any) string {
 	var parts []string
 
@@ -386,7 +388,7 @@ func ExtractText(app map[string]any) string {
 		}
 	}
 
-	return strings.Join(parts, " ")
+	return strings.Join(parts, "\n")
 }
 
 // extractFormText recursively extracts string values from form